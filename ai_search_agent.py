@@ -7,13 +7,33 @@ Combines Microsoft Edge automation with Google's Gemini AI for intelligent searc
 import os
 import sys
 import time
+import asyncio
+import threading
+import itertools
+import re
+import shelve
+import socket
+import hashlib
 import random
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import csv
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict
+from pathlib import Path
+from typing import List, Optional, Tuple, Dict, Deque, IO
+from collections import deque
+from contextlib import contextmanager
 import json
 import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+
+# Cross-process file locks (profiles and on-disk caches are shared by account workers)
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Suppress deprecation warning for pkg_resources
 warnings.filterwarnings("ignore", category=DeprecationWarning, module='pkg_resources')
@@ -23,11 +43,12 @@ try:
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
     from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+    from selenium.webdriver.remote.client_config import ClientConfig  # selenium >= 4.26
     from selenium.webdriver.common.by import By
     from selenium.webdriver.common.keys import Keys
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.common.action_chains import ActionChains
     from selenium.common.exceptions import TimeoutException
     from webdriver_manager.chrome import ChromeDriverManager
     
@@ -43,24 +64,179 @@ except ImportError as e:
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
+# Optional: selenium-wire lets a running browser switch upstream proxy (ROTATE_PROXIES=true).
+# Supported with selenium-wire 5.1 (no longer maintained upstream) on selenium 4.26+; Chrome is
+# pointed at its local proxy by hand (auto_config off), since auto_config passes the
+# desired_capabilities argument that selenium 4.10 removed.
+try:
+    from seleniumwire import webdriver as wire_webdriver
+except ImportError:
+    wire_webdriver = None
+
 # Initialize colorama for Windows
 init(autoreset=True)
 
+# Console templates for the per-cycle output, built once
+_BANNER_RULE = f"{Fore.MAGENTA}{'='*60}"
+_CYCLE_HEADER = f"\n{Fore.MAGENTA}[{{mode}} CYCLE] Cycle {{cycle}}/{{cycles}}\n{Fore.BLUE}{'─'*40}"
+_CYCLE_SUCCESS = f"{Fore.GREEN}[SUCCESS] {{label}} Success: {{query}}"
+_CYCLE_FAIL = f"{Fore.RED}[FAIL] {{label}} Failed: {{query}}"
+_CYCLE_PROGRESS = f"{Fore.CYAN}[PROGRESS] {{label}} Progress: {{successful}}/{{cycle}} successful"
+
+# Page locators, built once and shared by every search/login
+SB_FORM_Q = (By.ID, "sb_form_q")
+B_RESULTS = (By.ID, "b_results")
+SEARCH_ICON = (By.ID, "search_icon")
+LOGIN_EMAIL = (By.ID, "i0116")
+LOGIN_PASSWORD = (By.ID, "i0118")
+LOGIN_SUBMIT = (By.ID, "idSIButton9")
+LOGGED_IN_MARKER = (By.CSS_SELECTOR, "#id_n, #mectrl_currentAccount_secondary, [data-testid='user-name']")
+REWARDS_URL = "https://rewards.bing.com"
+
+# Saved session cookies per account and mode (see _save_cookies/_restore_cookies)
+COOKIE_CACHE_FILE = os.path.join('data', 'cookies.db')
+COOKIE_CACHE_LOCK = Path(f"{COOKIE_CACHE_FILE}.lock")
+QUERY_CACHE_FILE = os.path.join('data', 'query_cache.db')
+QUERY_CACHE_LOCK = Path(f"{QUERY_CACHE_FILE}.lock")
+COOKIE_PARAM_KEYS = ('name', 'value', 'domain', 'path', 'expires', 'httpOnly', 'secure', 'sameSite')
+WAIT_TIMEOUT = 15
+
+# Used when fake_useragent's database cannot be loaded
+DESKTOP_UAS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0"
+)
+
+# Per-mode browser settings; everything else about PC and Mobile runs is shared
+MODE_CONFIG = {
+    "pc": {
+        "label": "PC",
+        "args": [
+            "--window-size=1280,1024",
+            "--disable-blink-features=AutomationControlled",
+            "--disable-extensions",
+            "--no-sandbox",
+            "--disable-dev-shm-usage"
+        ],
+        "mobile_emulation": None,  # Uses a random desktop user agent instead
+        "wait_timeout": WAIT_TIMEOUT
+    },
+    "mobile": {
+        "label": "Mobile",
+        "args": ["--window-size=375,812"],
+        "mobile_emulation": {
+            "deviceMetrics": {"width": 375, "height": 812, "pixelRatio": 3.0},
+            "userAgent": "Mozilla/5.0 (Linux; Android 10; Pixel 4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Mobile Safari/537.36"
+        },
+        "wait_timeout": WAIT_TIMEOUT
+    }
+}
+
+# Keep-alive connections kept open to chromedriver per driver (urllib3 defaults to 1)
+COMMAND_POOL_SIZE = 10
+# Seconds before a chromedriver command gives up (selenium's own default for Chrome)
+COMMAND_TIMEOUT = 120
+
+# The agent only needs the DOM: skip images and fonts on every page load
+CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.cookies": 1
+}
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf"
+]
+
+# Analytics/ad hosts that never affect whether #b_results renders
+TRACKER_URL_PATTERNS = [
+    "*bat.bing.com*", "*clarity.ms*", "*doubleclick.net*", "*adnxs.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*scorecardresearch.com*",
+    "*facebook.net*", "*adsymptotic.com*", "*taboola.com*"
+]
+
 class AISearchAgent:
     """AI-powered search automation agent using Microsoft Edge and Google Gemini."""
     
-    def __init__(self, config_file: str = ".env"):
-        """Initialize the search agent with configuration."""
+    # Resolved chromedriver path, shared by every agent in the process
+    _cached_driver_path: Optional[str] = None
+    
+    # Background log writer shared by agents in the process; forked workers start their own
+    _log_listener: Optional[QueueListener] = None
+    _log_queue_handler: Optional[QueueHandler] = None
+    _log_pid: Optional[int] = None
+    _log_users = 0
+    _log_guard = threading.Lock()
+    
+    # Proxy health checks: TCP connect timeout, probe concurrency, re-probe backoff bounds
+    PROXY_PROBE_TIMEOUT = 2
+    PROXY_PROBE_WORKERS = 32
+    PROXY_RETRY_BASE = 60
+    PROXY_RETRY_CAP = 3600
+    
+    # Per-account Chrome profiles; a lock file next to each one keeps other processes out
+    PROFILES_DIR = Path('profiles')
+    PROFILE_LOCK_TIMEOUT = 300
+    
+    # fake_useragent database, loaded once per process (forked workers inherit it)
+    _SHARED_UA: Optional[UserAgent] = None
+    
+    # Refill the query buffer in the background once it drops to this size
+    QUERY_PREFETCH_THRESHOLD = 2
+    
+    # Queries generated per Gemini call; the surplus is kept on disk for later runs today
+    QUERY_CACHE_BATCH = 100
+    
+    # Gemini rate limiting: bounds for the adaptive spacing between calls
+    GEMINI_BACKOFF_FLOOR = 1.0
+    GEMINI_BACKOFF_CAP = 60.0
+    
+    # Problematic content in generated queries (substring match, case-insensitive)
+    _FORBIDDEN_RE = re.compile(r'explicit|illegal|hack|crack', re.IGNORECASE)
+    
+    def __init__(self, config_file: str = ".env", init_browsers: bool = True):
+        """Initialize the search agent with configuration.
+        
+        With init_browsers=False no browser is opened up front (account workers open
+        profile-bound ones in process_account; the dispatching agent needs none).
+        """
+        self.config_file = config_file
         self.load_config(config_file)
         self.setup_logging()
-        self.pc_driver: Optional[webdriver.Chrome] = None
-        self.mobile_driver: Optional[webdriver.Chrome] = None
+        self._drivers: Dict[str, Optional[webdriver.Remote]] = dict.fromkeys(MODE_CONFIG)
+        self._active_proxies: Dict[str, Optional[dict]] = {"pc": None, "mobile": None}
+        self._active_profiles: Dict[str, Optional[Path]] = {"pc": None, "mobile": None}
+        self._held_profile_locks: Dict[str, IO] = {}  # mode -> lock file of its profile
+        self._driver_waits: Dict[webdriver.Remote, WebDriverWait] = {}
+        self.csv_filename: Optional[str] = None  # Created by the first run(); dispatch-only agents have none
+        self._csv_file: Optional[IO] = None
+        self._shared_service: Optional[Service] = None
+        self._service_lock = threading.Lock()  # PC and Mobile may recover at the same moment
         self.ai_client = None
         self.pc_search_history: List[str] = []
         self.mobile_search_history: List[str] = []
-        self.user_agent = UserAgent()
+        self._history_lock = threading.Lock()  # PC and Mobile threads share the history
+        self._query_buffer: Deque[Tuple[str, str, str]] = deque()
+        self._query_lock = threading.Lock()
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gemini")
+        self._prefetch_future: Optional[Future] = None
+        self._gemini_state_lock = threading.Lock()
+        self._gemini_min_interval = 0.0
+        self._gemini_last_call = 0.0
+        self.user_agent = self._shared_user_agent()
+        self._base_args = self._build_base_args()
         self.session_start_time = datetime.now()
         self.proxies = self.load_proxies()  # Load proxies
+        self._proxy_lock = threading.Lock()
+        self._proxy_iter = self._build_proxy_rotation()
+        self._proxy_failures: Dict[str, int] = {}
+        self._proxy_quarantine: Dict[str, float] = {}  # proxy url -> earliest re-probe time
+        self._proxies_probed = False  # Probed on first rotation; account workers get theirs pre-picked
+        self._rotate_proxies = bool(self.config['rotate_proxies'] and self.proxies and wire_webdriver)
+        if self.config['rotate_proxies'] and wire_webdriver is None:
+            self.logger.warning(f"{Fore.YELLOW}[WARNING] ROTATE_PROXIES needs selenium-wire; proxies stay fixed per browser")
         
         # Search parameters
         self.search_params = {
@@ -78,9 +254,19 @@ class AISearchAgent:
         
         # Initialize components
         self._initialize_gemini()
-        self._initialize_pc_browser()
-        self._initialize_mobile_browser()
-        self._setup_csv_logging()
+        if init_browsers:
+            for mode in MODE_CONFIG:
+                self._initialize_browser(mode)
+
+    @property
+    def pc_driver(self) -> Optional[webdriver.Remote]:
+        """Active PC browser."""
+        return self._drivers["pc"]
+
+    @property
+    def mobile_driver(self) -> Optional[webdriver.Remote]:
+        """Active Mobile browser."""
+        return self._drivers["mobile"]
 
     def load_config(self, config_file: str) -> None:
         """Load configuration from environment file."""
@@ -94,6 +280,8 @@ class AISearchAgent:
             'max_cycles': int(os.getenv('MAX_SEARCH_CYCLES', '32')),
             'min_delay': int(os.getenv('MIN_DELAY', '10')),
             'max_delay': int(os.getenv('MAX_DELAY', '59')),
+            'max_parallel_accounts': int(os.getenv('MAX_PARALLEL_ACCOUNTS', '4')),
+            'rotate_proxies': os.getenv('ROTATE_PROXIES', 'False').lower() == 'true',
             'proxy': os.getenv('PROXY', None)
         }
         
@@ -103,14 +291,35 @@ class AISearchAgent:
     def setup_logging(self) -> None:
         """Setup logging configuration."""
         log_level = getattr(logging, self.config['log_level'].upper())
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('search_agent.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        root = logging.getLogger()
+        root.setLevel(log_level)
+        
+        # Callers only enqueue records; a listener thread does the file/console I/O
+        with AISearchAgent._log_guard:
+            if AISearchAgent._log_pid != os.getpid():
+                # A forked worker inherits the parent's handler, but not its listener thread
+                if AISearchAgent._log_queue_handler is not None:
+                    root.removeHandler(AISearchAgent._log_queue_handler)
+                AISearchAgent._log_listener = None
+                AISearchAgent._log_queue_handler = None
+                AISearchAgent._log_users = 0
+                AISearchAgent._log_pid = os.getpid()
+            
+            if AISearchAgent._log_listener is None:
+                formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+                handlers = [logging.FileHandler('search_agent.log'), logging.StreamHandler(sys.stdout)]
+                for handler in handlers:
+                    handler.setFormatter(formatter)
+                
+                queue_handler = QueueHandler(queue.Queue())
+                root.addHandler(queue_handler)
+                AISearchAgent._log_queue_handler = queue_handler
+                AISearchAgent._log_listener = QueueListener(queue_handler.queue, *handlers)
+                AISearchAgent._log_listener.start()
+            
+            AISearchAgent._log_users += 1
+        self._holds_log_listener = True
+        
         self.logger = logging.getLogger(__name__)
 
     def _initialize_gemini(self) -> None:
@@ -175,96 +384,410 @@ class AISearchAgent:
             self.logger.error(f"{Fore.RED}[FAIL] Failed to load proxies: {e}")
             return []
 
-    def _initialize_pc_browser(self, proxy=None) -> None:
-        """Initialize Chrome browser in PC mode with proxy support."""
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1280,1024")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument(f"--user-agent={self.user_agent.desktop}")
-
-            # Set proxy if provided
-            if proxy:
-                proxy_url = f"{proxy['host']}:{proxy['port']}"
-                if proxy['username'] and proxy['password']:
-                    proxy_url = f"http://{proxy['username']}:{proxy['password']}@{proxy['host']}:{proxy['port']}"
-                chrome_options.add_argument(f"--proxy-server={proxy_url}")
+    def _probe_proxies(self) -> None:
+        """TCP-probe every proxy in parallel and quarantine the unreachable ones."""
+        self._proxies_probed = True
+        if not self.proxies:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.PROXY_PROBE_WORKERS, len(self.proxies))) as pool:
+            results = list(pool.map(lambda p: _probe_proxy(p, self.PROXY_PROBE_TIMEOUT), self.proxies))
+        
+        for proxy, alive in zip(self.proxies, results):
+            if not alive:
+                self._mark_proxy_dead(proxy)
+        self.logger.info(f"{Fore.GREEN}[OK] {sum(results)}/{len(self.proxies)} proxies reachable")
+
+    def _mark_proxy_dead(self, proxy) -> None:
+        """Quarantine a proxy with exponential backoff before it is probed again."""
+        key = self._proxy_url(proxy)
+        fails = self._proxy_failures.get(key, 0)
+        self._proxy_failures[key] = fails + 1
+        self._proxy_quarantine[key] = time.time() + min(self.PROXY_RETRY_BASE * 2 ** fails, self.PROXY_RETRY_CAP)
+        self.logger.warning(f"{Fore.YELLOW}[WARNING] Proxy {proxy['host']}:{proxy['port']} unreachable, quarantined")
+
+    def _is_proxy_usable(self, proxy) -> bool:
+        """False while a proxy is quarantined; re-probes it once its backoff has elapsed."""
+        key = self._proxy_url(proxy)
+        retry_at = self._proxy_quarantine.get(key)
+        if retry_at is None:
+            return True
+        if time.time() < retry_at:
+            return False
+        if _probe_proxy(proxy, self.PROXY_PROBE_TIMEOUT):
+            del self._proxy_quarantine[key]
+            self._proxy_failures.pop(key, None)
+            return True
+        self._mark_proxy_dead(proxy)
+        return False
 
-            # Initialize driver
-            if self.config['edge_driver_path'] == 'auto':
-                service = Service(ChromeDriverManager().install())
-            else:
-                service = Service(self.config['edge_driver_path'])
-            self.pc_driver = webdriver.Chrome(service=service, options=chrome_options)
+    def _build_proxy_rotation(self):
+        """Round-robin iterator over the loaded proxies, starting at a random one."""
+        if not self.proxies:
+            return itertools.repeat(None)
+        rotation = itertools.cycle(self.proxies)
+        # Randomize the start so separate runs don't all begin on the first proxy
+        for _ in range(random.randrange(len(self.proxies))):
+            next(rotation)
+        return rotation
+
+    @classmethod
+    def _shared_user_agent(cls) -> Optional[UserAgent]:
+        """Return the process-wide UserAgent, loading its database on first use."""
+        if cls._SHARED_UA is None:
+            try:
+                cls._SHARED_UA = UserAgent()
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"{Fore.YELLOW}[WARNING] fake_useragent unavailable, using built-in user agents: {e}")
+        return cls._SHARED_UA
+
+    def _desktop_user_agent(self) -> str:
+        """Pick a desktop user agent string."""
+        if self.user_agent is not None:
+            return self.user_agent.desktop
+        return random.choice(DESKTOP_UAS)
+
+    @property
+    def _driver_path(self) -> str:
+        """Chromedriver path, resolved once per process instead of per browser."""
+        if self.config['edge_driver_path'] != 'auto':
+            return self.config['edge_driver_path']
+        if AISearchAgent._cached_driver_path is None:
+            AISearchAgent._cached_driver_path = ChromeDriverManager().install()
+        return AISearchAgent._cached_driver_path
+
+    @staticmethod
+    def _proxy_url(proxy) -> str:
+        """Build the Chrome proxy-server value for a proxy entry (empty if none)."""
+        if not proxy:
+            return ""
+        if proxy['username'] and proxy['password']:
+            return f"http://{proxy['username']}:{proxy['password']}@{proxy['host']}:{proxy['port']}"
+        return f"{proxy['host']}:{proxy['port']}"
+
+    @classmethod
+    def _profile_dir(cls, email: str, kind: str) -> Path:
+        """Persistent Chrome user-data-dir for an account and mode."""
+        return cls.PROFILES_DIR / hashlib.sha1(email.encode()).hexdigest()[:16] / kind
+
+    def _lock_profile(self, mode: str, profile_dir: Optional[Path]) -> None:
+        """Hold the profile directory's lock file for as long as the mode's driver lives."""
+        if profile_dir is None:
+            return
+        try:
+            lock_file = _acquire_file_lock(Path(f"{profile_dir}.lock"), self.PROFILE_LOCK_TIMEOUT)
+        except TimeoutError:
+            raise RuntimeError(f"Chrome profile {profile_dir} is in use by another browser") from None
+        self._held_profile_locks[mode] = lock_file
+
+    def _unlock_profile(self, mode: str) -> None:
+        """Release a profile lock taken by _lock_profile."""
+        lock_file = self._held_profile_locks.pop(mode, None)
+        if lock_file:
+            _release_file_lock(lock_file)
+
+    def _get_shared_service(self) -> Service:
+        """Return the single chromedriver process shared by the PC and Mobile sessions."""
+        with self._service_lock:
+            if self._shared_service is None or not self._shared_service.is_connectable():
+                if self._shared_service is not None:
+                    try:
+                        self._shared_service.stop()  # Reap the dead process before replacing it
+                    except Exception:
+                        pass
+                self._shared_service = Service(self._driver_path)
+                self._shared_service.start()
+            return self._shared_service
+
+    def _wire_proxy(self, proxy) -> dict:
+        """selenium-wire upstream proxy settings for a proxy entry (direct if none)."""
+        proxy_url = self._proxy_url(proxy)
+        if not proxy_url:
+            return {}
+        if not proxy_url.startswith("http"):
+            proxy_url = f"http://{proxy_url}"
+        return {'http': proxy_url, 'https': proxy_url, 'no_proxy': 'localhost,127.0.0.1'}
+
+    def _rotate_proxy(self, mode: str) -> None:
+        """Point a running browser at the next proxy without restarting it (selenium-wire only)."""
+        if not self._rotate_proxies:
+            return
+        try:
+            proxy = self._get_next_proxy()
+        except RuntimeError as e:
+            self.logger.warning(f"{Fore.YELLOW}[WARNING] {e}; {mode.upper()} keeps its current proxy")
+            return
+        self._drivers[mode].proxy = self._wire_proxy(proxy)
+        self.logger.info(f"{Fore.BLUE}[PROXY] {mode.upper()} now using {proxy['host']}:{proxy['port']}")
+
+    def _create_driver(self, chrome_options: Options, proxy=None) -> webdriver.Remote:
+        """Open a new browser session on the shared chromedriver process."""
+        service = self._get_shared_service()
+        # Several keep-alive connections to chromedriver per driver (urllib3 defaults to 1).
+        # Selenium reads the pool kwargs from a nested "init_args_for_pool_manager" key.
+        client_config = ClientConfig(
+            remote_server_addr=service.service_url,
+            keep_alive=True,
+            timeout=COMMAND_TIMEOUT,
+            init_args_for_pool_manager={
+                "init_args_for_pool_manager": {"maxsize": COMMAND_POOL_SIZE, "block": False}
+            }
+        )
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service.service_url,
+            vendor_prefix="goog",
+            browser_name="chrome",
+            keep_alive=True,
+            client_config=client_config
+        )
+        chrome_options.add_experimental_option("prefs", CONTENT_PREFS)
+        # driver.get() returns at DOMContentLoaded; callers wait for their elements explicitly
+        chrome_options.page_load_strategy = 'eager'
+        # webdriver.Remote leaves the service running on quit(), unlike webdriver.Chrome
+        if self._rotate_proxies:
+            port = _free_port()
+            chrome_options.add_argument(f"--proxy-server=127.0.0.1:{port}")
+            chrome_options.set_capability('acceptInsecureCerts', True)  # selenium-wire re-signs HTTPS
+            driver = wire_webdriver.Remote(
+                command_executor=executor,
+                options=chrome_options,
+                seleniumwire_options={
+                    'auto_config': False,
+                    'disable_capture': True,  # The agent never reads driver.requests
+                    'addr': '127.0.0.1',
+                    'port': port,
+                    'proxy': self._wire_proxy(proxy)
+                }
+            )
+        else:
+            driver = webdriver.Remote(command_executor=executor, options=chrome_options)
+        self._block_heavy_resources(driver)
+        return driver
 
-            self.logger.info(f"{Fore.GREEN}[OK] PC Browser initialized successfully in headless mode")
+    @staticmethod
+    def _cdp(driver, cmd: str, params: Optional[dict] = None) -> dict:
+        """Send a Chrome DevTools Protocol command through the driver."""
+        return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
 
+    def _block_heavy_resources(self, driver) -> None:
+        """Abort image, font and tracker requests at the network layer."""
+        try:
+            self._cdp(driver, "Network.enable")
+            self._cdp(driver, "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS + TRACKER_URL_PATTERNS})
         except Exception as e:
-            self.logger.error(f"{Fore.RED}[FAIL] Failed to initialize PC Browser: {e}")
-            raise
-
-    def _initialize_mobile_browser(self, proxy=None) -> None:
-        """Initialize Chrome browser in Mobile mode with proxy support."""
+            self.logger.debug(f"Resource blocking unavailable: {e}")
+
+    def _wait(self, driver, timeout: float = WAIT_TIMEOUT) -> WebDriverWait:
+        """Return the cached WebDriverWait for a driver."""
+        wait = self._driver_waits.get(driver)
+        if wait is None:
+            wait = self._driver_waits[driver] = WebDriverWait(driver, timeout)
+        return wait
+
+    def _discard_browser(self, mode: str) -> None:
+        """Quit and forget a mode's driver (e.g. after a crash) and release its profile."""
+        driver, self._drivers[mode] = self._drivers[mode], None
+        if driver:
+            self._driver_waits.pop(driver, None)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._unlock_profile(mode)
+
+    def _build_base_args(self) -> Dict[str, List[str]]:
+        """Chrome arguments shared by every browser of each mode, computed once per agent."""
+        base_args = {}
+        for mode, mode_config in MODE_CONFIG.items():
+            args = ["--headless=new", "--disable-gpu", *mode_config["args"]]
+            if not mode_config["mobile_emulation"]:
+                args.append(f"--user-agent={self._desktop_user_agent()}")
+            base_args[mode] = args
+        return base_args
+
+    def _initialize_browser(self, mode: str, proxy=None, profile_dir: Optional[Path] = None) -> webdriver.Remote:
+        """Initialize a headless Chrome browser for a mode (see MODE_CONFIG) with proxy support.
+        
+        With profile_dir, Chrome keeps cookies on disk so later runs can skip the login flow.
+        """
+        mode_config = MODE_CONFIG[mode]
+        self._discard_browser(mode)  # One browser per mode; replace any previous one
+        self._active_proxies[mode] = proxy
+        self._active_profiles[mode] = profile_dir
+        self._lock_profile(mode, profile_dir)
         try:
             chrome_options = Options()
-            chrome_options.add_argument("--headless=new")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=375,812")
-
-            mobile_emulation = {
-                "deviceMetrics": {"width": 375, "height": 812, "pixelRatio": 3.0},
-                "userAgent": "Mozilla/5.0 (Linux; Android 10; Pixel 4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Mobile Safari/537.36"
-            }
-            chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
+            for argument in self._base_args[mode]:
+                chrome_options.add_argument(argument)
+            
+            if mode_config["mobile_emulation"]:
+                chrome_options.add_experimental_option("mobileEmulation", mode_config["mobile_emulation"])
 
-            # Set proxy if provided
-            if proxy:
-                proxy_url = f"{proxy['host']}:{proxy['port']}"
-                if proxy['username'] and proxy['password']:
-                    proxy_url = f"http://{proxy['username']}:{proxy['password']}@{proxy['host']}:{proxy['port']}"
+            # Set proxy if provided (selenium-wire routes it instead when rotating)
+            proxy_url = self._proxy_url(proxy)
+            if proxy_url and not self._rotate_proxies:
                 chrome_options.add_argument(f"--proxy-server={proxy_url}")
 
+            # Persist the account session between runs
+            if profile_dir is not None:
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                chrome_options.add_argument(f"--user-data-dir={profile_dir.resolve()}")
+                chrome_options.add_argument("--profile-directory=Default")
+
             # Initialize driver
-            if self.config['edge_driver_path'] == 'auto':
-                service = Service(ChromeDriverManager().install())
-            else:
-                service = Service(self.config['edge_driver_path'])
-            self.mobile_driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = self._create_driver(chrome_options, proxy)
+            self._drivers[mode] = driver
 
-            self.logger.info(f"{Fore.GREEN}[OK] Mobile Browser initialized successfully in headless mode")
+            self.logger.info(f"{Fore.GREEN}[OK] {mode_config['label']} Browser initialized successfully in headless mode")
+            return driver
 
         except Exception as e:
-            self.logger.error(f"{Fore.RED}[FAIL] Failed to initialize Mobile Browser: {e}")
+            self._unlock_profile(mode)
+            self.logger.error(f"{Fore.RED}[FAIL] Failed to initialize {mode_config['label']} Browser: {e}")
             raise
 
     def _setup_csv_logging(self) -> None:
         """Setup CSV logging for search results."""
-        self.csv_filename = f"search_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        with open(self.csv_filename, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                'timestamp', 'generated_query', 'search_url', 
-                'response_status', 'execution_time', 'category', 'query_type', 'mode'
-            ])
+        # Account workers start in parallel: tag the name with the pid and never reuse an existing file
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        for attempt in itertools.count():
+            suffix = f"_{attempt}" if attempt else ""
+            self.csv_filename = f"search_log_{stamp}_{os.getpid()}{suffix}.csv"
+            try:
+                # Kept open for the agent's lifetime; line buffering flushes every row
+                self._csv_file = open(self.csv_filename, 'x', newline='', encoding='utf-8', buffering=1)
+                break
+            except FileExistsError:
+                continue
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow([
+            'timestamp', 'generated_query', 'search_url', 
+            'response_status', 'execution_time', 'category', 'query_type', 'mode'
+        ])
         
         self.logger.info(f"{Fore.CYAN}[LOG] CSV logging initialized: {self.csv_filename}")
 
     def generate_search_query(self) -> Tuple[str, str, str]:
-        """Generate an AI-powered search query using Gemini."""
+        """Return the next AI-powered search query, served from the prefetched batch buffer."""
+        with self._query_lock:
+            item = self._query_buffer.popleft() if self._query_buffer else None
+        
+        if item is None:
+            # Buffer drained: join the in-flight refill (or start one) so concurrent callers share it
+            self._schedule_query_prefetch().result()
+            with self._query_lock:
+                item = self._query_buffer.popleft() if self._query_buffer else None
+        
+        # Prefetch the next batch in the background while Selenium works
+        self._schedule_query_prefetch()
+        
+        if item is None:
+            # Fallback query
+            fallback_query = f"what is {random.choice(self.search_params['categories'])}"
+            self.logger.warning(f"{Fore.YELLOW}[WARNING] Using fallback query: {fallback_query}")
+            return fallback_query, "general", "fallback"
+        
+        query, category, query_type = item
+        with self._history_lock:
+            self.pc_search_history.append(query)
+            self.mobile_search_history.append(query)
+            if len(self.pc_search_history) > 20:  # Keep only recent history
+                self.pc_search_history = self.pc_search_history[-20:]
+            if len(self.mobile_search_history) > 20:  # Keep only recent history
+                self.mobile_search_history = self.mobile_search_history[-20:]
+        
+        self.logger.info(f"{Fore.YELLOW}[AI] Generated query: {query}")
+        return query, category, query_type
+
+    def _schedule_query_prefetch(self) -> Future:
+        """Start a background refill when the buffer is running low; returns the latest refill."""
+        with self._query_lock:
+            in_flight = self._prefetch_future is not None and not self._prefetch_future.done()
+            if not in_flight and len(self._query_buffer) <= self.QUERY_PREFETCH_THRESHOLD:
+                self._prefetch_future = self._prefetch_executor.submit(self._refill_query_buffer)
+            elif self._prefetch_future is None:
+                self._prefetch_future = Future()
+                self._prefetch_future.set_result(None)
+            return self._prefetch_future
+
+    def _refill_query_buffer(self) -> None:
+        """Refill the buffer from today's on-disk query cache, calling Gemini only when it is empty."""
+        count = self.config['max_cycles']
+        batch = self._take_cached_queries(count)
+        if not batch:
+            generated = self._generate_query_batch(max(count, self.QUERY_CACHE_BATCH))
+            batch, surplus = generated[:count], generated[count:]
+            self._store_cached_queries(surplus)
+        with self._query_lock:
+            self._query_buffer.extend(batch)
+
+    def _take_cached_queries(self, count: int) -> List[Tuple[str, str, str]]:
+        """Pop up to count queries generated earlier today from the disk cache."""
+        today = datetime.now().date().isoformat()
+        try:
+            with _file_lock(QUERY_CACHE_LOCK), shelve.open(QUERY_CACHE_FILE) as cache:
+                cached = cache.get(today, [])
+                cache[today] = cached[count:]
+            if cached:
+                self.logger.info(f"{Fore.YELLOW}[AI] Using {len(cached[:count])} cached queries")
+            return cached[:count]
+        except Exception as e:
+            self.logger.debug(f"Query cache unavailable: {e}")
+            return []
+
+    def _store_cached_queries(self, queries: List[Tuple[str, str, str]]) -> None:
+        """Append queries to today's disk cache, dropping entries from earlier days."""
+        if not queries:
+            return
+        today = datetime.now().date().isoformat()
+        try:
+            with _file_lock(QUERY_CACHE_LOCK), shelve.open(QUERY_CACHE_FILE) as cache:
+                for day in [key for key in cache.keys() if key != today]:
+                    del cache[day]
+                cache[today] = cache.get(today, []) + list(queries)
+        except Exception as e:
+            self.logger.debug(f"Could not write query cache: {e}")
+
+    def _call_gemini(self, prompt: str):
+        """Call Gemini with adaptive, jittered spacing between calls."""
+        with self._gemini_state_lock:
+            # Jittered spacing so retries from several threads don't fire together
+            interval = self._gemini_min_interval * random.uniform(0.5, 1.5)
+            wait = self._gemini_last_call + interval - time.time()
+            self._gemini_last_call = max(self._gemini_last_call + interval, time.time())
+        if wait > 0:
+            time.sleep(wait)
+        
+        try:
+            response = self.ai_client.generate_content(prompt)
+        except Exception:
+            with self._gemini_state_lock:
+                self._gemini_min_interval = min(
+                    max(self._gemini_min_interval * 2, self.GEMINI_BACKOFF_FLOOR),
+                    self.GEMINI_BACKOFF_CAP
+                )
+            raise
+        
+        with self._gemini_state_lock:
+            self._gemini_min_interval *= 0.9
+        return response
+
+    def _generate_query_batch(self, count: int) -> List[Tuple[str, str, str]]:
+        """Generate a batch of search queries with a single Gemini request."""
         max_retries = 3
         
         for attempt in range(max_retries):
             try:
-                # Select random parameters
-                category = random.choice(self.search_params["categories"])
-                query_type = random.choice(self.search_params["query_types"])
-                complexity = random.choice(self.search_params["complexity_levels"])
+                # Select random parameters for each query in the batch
+                specs = [
+                    (random.choice(self.search_params["complexity_levels"]),
+                     random.choice(self.search_params["query_types"]),
+                     random.choice(self.search_params["categories"]))
+                    for _ in range(count)
+                ]
+                spec_lines = "\n".join(
+                    f"{i}. {complexity} {query_type} about {category}"
+                    for i, (complexity, query_type, category) in enumerate(specs, 1)
+                )
                 
                 # Create context-aware prompt
                 history_context = ""
@@ -273,46 +796,44 @@ class AISearchAgent:
                     history_context = f"Recent search topics: {', '.join(recent_searches)}. "
                 
                 prompt = f"""
-                {history_context}Generate a {complexity} {query_type} about {category} that would be suitable for a Bing search.
+                {history_context}Generate {count} search queries suitable for a Bing search, one for each line below:
+                
+                {spec_lines}
                 
                 Requirements:
-                - Make it naturally human-like and interesting
-                - 3-15 words maximum
-                - Avoid repetition of recent topics
+                - Make them naturally human-like and interesting
+                - 3-15 words maximum each
+                - Avoid repetition of recent topics and of each other
                 - Be specific enough to get good search results
                 - Safe for general audiences
                 
-                Category: {category}
-                Type: {query_type}
-                Complexity: {complexity}
-                
-                Respond with ONLY the search query, nothing else.
+                Respond with ONLY a JSON array of objects in the same order, nothing else:
+                [{{"query": "...", "category": "...", "type": "..."}}, ...]
                 """
                 
-                response = self.ai_client.generate_content(prompt)
-                query = response.text.strip().strip('"').strip("'")
+                response = self._call_gemini(prompt)
+                text = response.text.strip()
+                if text.startswith("```"):  # Strip markdown code fences
+                    text = text.strip("`")
+                    text = text[text.index("["):] if "[" in text else text
+                items = json.loads(text)
                 
-                # Validate query
-                if self._validate_query(query):
-                    self.pc_search_history.append(query)
-                    self.mobile_search_history.append(query)
-                    if len(self.pc_search_history) > 20:  # Keep only recent history
-                        self.pc_search_history = self.pc_search_history[-20:]
-                    if len(self.mobile_search_history) > 20:  # Keep only recent history
-                        self.mobile_search_history = self.mobile_search_history[-20:]
-                    
-                    self.logger.info(f"{Fore.YELLOW}[AI] Generated query: {query}")
-                    return query, category, query_type
+                batch = []
+                for item in items:
+                    query = str(item.get("query", "")).strip().strip('"').strip("'")
+                    # Validate query
+                    if self._validate_query(query):
+                        batch.append((query, item.get("category", "general"), item.get("type", "question")))
+                
+                if batch:
+                    self.logger.info(f"{Fore.YELLOW}[AI] Generated batch of {len(batch)} queries")
+                    return batch
                 
             except Exception as e:
+                # Backoff between attempts is handled by _call_gemini's adaptive spacing
                 self.logger.warning(f"{Fore.YELLOW}[WARNING] Query generation attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt) # Exponential backoff
         
-        # Fallback query
-        fallback_query = f"what is {random.choice(self.search_params['categories'])}"
-        self.logger.warning(f"{Fore.YELLOW}[WARNING] Using fallback query: {fallback_query}")
-        return fallback_query, "general", "fallback"
+        return []
 
     def _validate_query(self, query: str) -> bool:
         """Validate generated search query."""
@@ -323,8 +844,7 @@ class AISearchAgent:
             return False
             
         # Check for problematic content
-        forbidden_terms = ['explicit', 'illegal', 'hack', 'crack']
-        if any(term in query.lower() for term in forbidden_terms):
+        if self._FORBIDDEN_RE.search(query):
             return False
             
         return True
@@ -334,8 +854,8 @@ class AISearchAgent:
         start_time = time.time()
         max_retries = 3  # Number of retries before giving up
         retry_delay = 2  # Delay between retries in seconds
-        driver = self.pc_driver if mode == "pc" else self.mobile_driver
-        search_history = self.pc_search_history if mode == "pc" else self.mobile_search_history
+        driver = self._drivers[mode]
+        wait = self._wait(driver, MODE_CONFIG[mode]["wait_timeout"])
 
         for attempt in range(max_retries):
             try:
@@ -344,12 +864,7 @@ class AISearchAgent:
                 driver.get("https://www.bing.com")
 
                 # Wait for the search box to be present
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.ID, "sb_form_q"))
-                )
-
-                # Find search box
-                search_box = driver.find_element(By.ID, "sb_form_q")
+                search_box = wait.until(EC.presence_of_element_located(SB_FORM_Q))
 
                 # Clear any existing text
                 search_box.clear()
@@ -365,15 +880,11 @@ class AISearchAgent:
                     search_box.send_keys(Keys.RETURN)
                 else:
                     # Wait for the search button to be clickable
-                    search_button = WebDriverWait(driver, 15).until(
-                        EC.element_to_be_clickable((By.ID, "search_icon"))
-                    )
+                    search_button = wait.until(EC.element_to_be_clickable(SEARCH_ICON))
                     search_button.click()
 
                 # Wait for results
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.ID, "b_results"))
-                )
+                wait.until(EC.presence_of_element_located(B_RESULTS))
 
                 execution_time = time.time() - start_time
                 current_url = driver.current_url
@@ -395,32 +906,33 @@ class AISearchAgent:
         return False, "error: all retries failed", execution_time
 
     def _human_like_typing(self, element, text: str) -> None:
-        """Simulate human-like typing with variable speeds and occasional mistakes."""
-        for char in text:
-            element.send_keys(char)
-            # Variable typing speed
-            time.sleep(random.uniform(0.05, 0.15))
-            
-            # Occasional pause (like thinking)
-            if random.random() < 0.1:
-                time.sleep(random.uniform(0.2, 0.8))
+        """Fill the search box in one WebDriver call, then pause like a human would."""
+        # One round-trip instead of a send_keys per character
+        element.parent.execute_script(
+            "arguments[0].value = arguments[1];"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
+            element, text
+        )
+        time.sleep(random.uniform(0.3, 0.9))
+        
+        # Occasional pause (like thinking)
+        if random.random() < 0.1:
+            time.sleep(random.uniform(0.2, 0.8))
 
     def _simulate_human_behavior(self, driver) -> None:
         """Simulate human browsing behavior."""
         try:
-            actions = ActionChains(driver)
-            
-            # Random mouse movements
-            for _ in range(random.randint(2, 5)):
-                x_offset = random.randint(-100, 100)
-                y_offset = random.randint(-100, 100)
-                actions.move_by_offset(x_offset, y_offset)
-            
-            actions.perform()
-            
-            # Random scrolling
+            # Random mouse movements and scrolling in a single round-trip
             scroll_distance = random.randint(300, 800)
-            driver.execute_script(f"window.scrollBy(0, {scroll_distance});")
+            driver.execute_script(
+                "const moves = arguments[0], distance = arguments[1];"
+                "window.scrollBy(0, distance);"
+                "for (let i = 0; i < moves; i++) {"
+                "  document.dispatchEvent(new MouseEvent('mousemove', "
+                "    {clientX: Math.random() * 500, clientY: Math.random() * 500, bubbles: true}));"
+                "}",
+                random.randint(2, 5), scroll_distance
+            )
             
             time.sleep(random.uniform(1, 3))
             
@@ -437,42 +949,30 @@ class AISearchAgent:
         timestamp = datetime.now().isoformat()
         status = "success" if success else "failed"
         
-        with open(self.csv_filename, 'a', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                timestamp, query, url, status, f"{execution_time:.2f}",
-                category, query_type, mode
-            ])
+        self._csv_writer.writerow([
+            timestamp, query, url, status, f"{execution_time:.2f}",
+            category, query_type, mode
+        ])
 
-    def _random_delay(self) -> None:
-        """Implement random delay between searches."""
+    def _next_delay(self) -> int:
+        """Pick and announce a random delay before the next search."""
         delay = random.randint(self.config['min_delay'], self.config['max_delay'])
-        self.logger.info(f"{Fore.CYAN}[WAIT] Waiting {delay} seconds before next search...")
-          # Show countdown
-        for remaining in range(delay, 0, -1):
-            print(f"\r{Fore.CYAN}[WAIT] Next search in: {remaining:2d}s", end="", flush=True)
-            time.sleep(1)
-        print()  # New line after countdown
+        resume_at = datetime.fromtimestamp(time.time() + delay).strftime('%H:%M:%S')
+        self.logger.info(f"{Fore.CYAN}[WAIT] Waiting {delay} seconds before next search (resuming at {resume_at})...")
+        return delay
 
     def _recover_from_browser_crash(self, mode: str) -> bool:
         """Attempt to recover from browser crashes."""
         try:
             self.logger.warning(f"{Fore.YELLOW}[RECOVER] Attempting {mode.upper()} browser recovery...")
             
-            driver = self.pc_driver if mode == "pc" else self.mobile_driver
-            
-            if driver:
-                try:
-                    driver.quit()
-                except Exception:
-                    pass
+            proxy = self._active_proxies[mode]
+            profile_dir = self._active_profiles[mode]
+            self._discard_browser(mode)
             
             time.sleep(5)  # Wait before reinitialization
             
-            if mode == "pc":
-                self._initialize_pc_browser()
-            else:
-                self._initialize_mobile_browser()
+            self._initialize_browser(mode, proxy, profile_dir)
             
             return True
         except Exception as e:
@@ -481,106 +981,96 @@ class AISearchAgent:
 
     def run(self, pc_cycles: Optional[int] = None, mobile_cycles: Optional[int] = None) -> None:
         """Main execution loop for the search agent."""
+        asyncio.run(self.run_async(pc_cycles, mobile_cycles))
+
+    async def run_async(self, pc_cycles: Optional[int] = None, mobile_cycles: Optional[int] = None) -> None:
+        """Run PC and Mobile cycles concurrently, each on its own browser thread."""
         if pc_cycles is None:
-            pc_cycles = self.config['max_cycles'] // 1.6875
+            # 16/27 of the cycles go to PC (the old `// 1.6875` produced a float)
+            pc_cycles = self.config['max_cycles'] * 16 // 27
         if mobile_cycles is None:
             mobile_cycles = self.config['max_cycles'] - pc_cycles
+        if self._csv_file is None:
+            self._setup_csv_logging()
         
         self.logger.info(f"{Fore.MAGENTA}[START] Starting AI Search Agent - PC: {pc_cycles} cycles, Mobile: {mobile_cycles} cycles")
-        print(f"\n{Fore.MAGENTA}{'='*60}")
+        print(f"\n{_BANNER_RULE}")
         print(f"{Fore.MAGENTA}[AGENT] Microsoft Rewards Agent - AI Search Automation")
-        print(f"{Fore.MAGENTA}{'='*60}")
+        print(_BANNER_RULE)
         print(f"{Fore.CYAN}[INFO] PC Cycles: {pc_cycles}")
         print(f"{Fore.CYAN}[INFO] Mobile Cycles: {mobile_cycles}")
         print(f"{Fore.CYAN}[TIME] Delay Range: {self.config['min_delay']}-{self.config['max_delay']}s")
         print(f"{Fore.CYAN}[LOG] Log File: {self.csv_filename}")
-        print(f"{Fore.MAGENTA}{'='*60}\n")
+        print(f"{_BANNER_RULE}\n")
+        
+        # Fill the query buffer once up front so both modes start from the same Gemini batch
+        if pc_cycles + mobile_cycles > 0:
+            await asyncio.wrap_future(self._schedule_query_prefetch())
         
+        cycles = {"pc": pc_cycles, "mobile": mobile_cycles}
+        results = await asyncio.gather(*(self._run_mode(mode, cycles[mode]) for mode in MODE_CONFIG))
+        
+        successful_searches = sum(successful for successful, _ in results)
+        failed_searches = sum(failed for _, failed in results)
+        
+        # Final summary
+        self._print_final_summary(successful_searches, failed_searches, pc_cycles + mobile_cycles)
+
+    async def _run_mode(self, mode: str, cycles: int) -> Tuple[int, int]:
+        """Run search cycles for one mode, dispatching blocking calls to the mode's own thread."""
+        # One single-threaded executor per driver: Selenium sessions are not thread-safe
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=mode)
+        try:
+            return await self._run_cycles(mode, cycles, pool)
+        finally:
+            pool.shutdown(wait=True)
+
+    async def _run_cycles(self, mode: str, cycles: int, pool: ThreadPoolExecutor) -> Tuple[int, int]:
+        """Search cycle loop for one mode."""
+        loop = asyncio.get_running_loop()
+        label = MODE_CONFIG[mode]["label"]
         successful_searches = 0
         failed_searches = 0
         
-        # Run PC searches first
-        if pc_cycles > 0:
-            for cycle in range(1, pc_cycles + 1):
-                try:
-                    print(f"\n{Fore.MAGENTA}[PC CYCLE] Cycle {cycle}/{pc_cycles}")
-                    print(f"{Fore.BLUE}{'─'*40}")
-                    
-                    # Generate AI query
-                    query, category, query_type = self.generate_search_query()
-                    
-                    # Execute search
-                    success, url, execution_time = self.execute_search(query, "pc")
-                    
-                    # Log result
-                    self._log_search_result(query, category, query_type, success, url, execution_time, "pc")
-                    
-                    if success:
-                        successful_searches += 1
-                        print(f"{Fore.GREEN}[SUCCESS] PC Success: {query}")
-                    else:
-                        failed_searches += 1
-                        print(f"{Fore.RED}[FAIL] PC Failed: {query}")
-                    
-                    # Progress summary
-                    print(f"{Fore.CYAN}[PROGRESS] PC Progress: {successful_searches}/{cycle} successful")
-                    
-                    # Random delay before next cycle (except for the last cycle)
-                    if cycle < pc_cycles:
-                        self._random_delay()
-                    
-                except Exception as e:
-                    self.logger.error(f"{Fore.RED}[FAIL] PC Cycle {cycle} failed: {e}")
-                    failed_searches += 1
-                    
-                    # Attempt browser recovery
-                    if "driver" in str(e).lower() or "session" in str(e).lower():
-                        if not self._recover_from_browser_crash("pc"):
-                            self.logger.error(f"{Fore.RED}[FAIL] Cannot continue - browser recovery failed")
-                            break
-        
-        # Run Mobile searches next
-        if mobile_cycles > 0:
-            for cycle in range(1, mobile_cycles + 1):
-                try:
-                    print(f"\n{Fore.MAGENTA}[MOBILE CYCLE] Cycle {cycle}/{mobile_cycles}")
-                    print(f"{Fore.BLUE}{'─'*40}")
-                    
-                    # Generate AI query
-                    query, category, query_type = self.generate_search_query()
-                    
-                    # Execute search
-                    success, url, execution_time = self.execute_search(query, "mobile")
-                    
-                    # Log result
-                    self._log_search_result(query, category, query_type, success, url, execution_time, "mobile")
-                    
-                    if success:
-                        successful_searches += 1
-                        print(f"{Fore.GREEN}[SUCCESS] Mobile Success: {query}")
-                    else:
-                        failed_searches += 1
-                        print(f"{Fore.RED}[FAIL] Mobile Failed: {query}")
-                    
-                    # Progress summary
-                    print(f"{Fore.CYAN}[PROGRESS] Mobile Progress: {successful_searches}/{cycle} successful")
-                    
-                    # Random delay before next cycle (except for the last cycle)
-                    if cycle < mobile_cycles:
-                        self._random_delay()
-                    
-                except Exception as e:
-                    self.logger.error(f"{Fore.RED}[FAIL] Mobile Cycle {cycle} failed: {e}")
+        for cycle in range(1, cycles + 1):
+            try:
+                print(_CYCLE_HEADER.format(mode=mode.upper(), cycle=cycle, cycles=cycles))
+                
+                # Generate AI query
+                query, category, query_type = await loop.run_in_executor(pool, self.generate_search_query)
+                
+                # Execute search
+                success, url, execution_time = await loop.run_in_executor(pool, self.execute_search, query, mode)
+                
+                # Log result
+                self._log_search_result(query, category, query_type, success, url, execution_time, mode)
+                
+                if success:
+                    successful_searches += 1
+                    print(_CYCLE_SUCCESS.format(label=label, query=query))
+                else:
                     failed_searches += 1
-                    
-                    # Attempt browser recovery
-                    if "driver" in str(e).lower() or "session" in str(e).lower():
-                        if not self._recover_from_browser_crash("mobile"):
-                            self.logger.error(f"{Fore.RED}[FAIL] Cannot continue - browser recovery failed")
-                            break
+                    print(_CYCLE_FAIL.format(label=label, query=query))
+                
+                # Progress summary
+                print(_CYCLE_PROGRESS.format(label=label, successful=successful_searches, cycle=cycle))
+                
+                # Random delay before next cycle (except for the last cycle)
+                if cycle < cycles:
+                    await loop.run_in_executor(pool, self._rotate_proxy, mode)
+                    await asyncio.sleep(self._next_delay())
+                
+            except Exception as e:
+                self.logger.error(f"{Fore.RED}[FAIL] {label} Cycle {cycle} failed: {e}")
+                failed_searches += 1
+                
+                # Attempt browser recovery
+                if "driver" in str(e).lower() or "session" in str(e).lower():
+                    if not await loop.run_in_executor(pool, self._recover_from_browser_crash, mode):
+                        self.logger.error(f"{Fore.RED}[FAIL] Cannot continue - browser recovery failed")
+                        break
         
-        # Final summary
-        self._print_final_summary(successful_searches, failed_searches, pc_cycles + mobile_cycles)
+        return successful_searches, failed_searches
 
     def _print_final_summary(self, successful: int, failed: int, total_planned: int) -> None:
         """Print execution summary."""
@@ -588,27 +1078,62 @@ class AISearchAgent:
         success_rate = (successful / total_executed * 100) if total_executed > 0 else 0
         session_duration = datetime.now() - self.session_start_time
         
-        print(f"\n{Fore.MAGENTA}{'='*60}")
+        print(f"\n{_BANNER_RULE}")
         print(f"{Fore.MAGENTA}[SUMMARY] EXECUTION SUMMARY")
-        print(f"{Fore.MAGENTA}{'='*60}")
+        print(_BANNER_RULE)
         print(f"{Fore.GREEN}[SUCCESS] Successful searches: {successful}")
         print(f"{Fore.RED}[FAIL] Failed searches: {failed}")
         print(f"{Fore.CYAN}[STATS] Success rate: {success_rate:.1f}%")
         print(f"{Fore.CYAN}[TIME] Session duration: {session_duration}")
         print(f"{Fore.CYAN}[LOG] Results logged to: {self.csv_filename}")
-        print(f"{Fore.MAGENTA}{'='*60}\n")
+        print(f"{_BANNER_RULE}\n")
 
     def cleanup(self) -> None:
         """Clean up resources."""
-        try:
-            if self.pc_driver:
-                self.pc_driver.quit()
-                self.logger.info(f"{Fore.GREEN}[OK] PC Browser cleanup completed")
-            if self.mobile_driver:
-                self.mobile_driver.quit()
-                self.logger.info(f"{Fore.GREEN}[OK] Mobile Browser cleanup completed")
-        except Exception as e:
-            self.logger.warning(f"{Fore.YELLOW}[WARNING] Cleanup warning: {e}")
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        # Hand unused queries back to the disk cache so later runs don't call Gemini for them
+        with self._query_lock:
+            leftover = list(self._query_buffer)
+            self._query_buffer.clear()
+        self._store_cached_queries(leftover)
+        for mode, driver in self._drivers.items():
+            if driver:
+                try:
+                    driver.quit()
+                    self.logger.info(f"{Fore.GREEN}[OK] {MODE_CONFIG[mode]['label']} Browser cleanup completed")
+                except Exception as e:
+                    self.logger.warning(f"{Fore.YELLOW}[WARNING] Cleanup warning: {e}")
+            self._unlock_profile(mode)
+        self._driver_waits.clear()
+        self._drivers = dict.fromkeys(MODE_CONFIG)
+        if self._shared_service:
+            try:
+                self._shared_service.stop()
+            except Exception as e:
+                self.logger.warning(f"{Fore.YELLOW}[WARNING] Cleanup warning: {e}")
+            self._shared_service = None
+        if self._csv_file and not self._csv_file.closed:
+            self._csv_file.close()
+        if getattr(self, '_holds_log_listener', False):
+            self._holds_log_listener = False
+            self._release_log_listener()
+
+    @classmethod
+    def _release_log_listener(cls) -> None:
+        """Drop one agent's hold on the log writer; the last agent in the process stops it."""
+        with cls._log_guard:
+            if cls._log_pid != os.getpid() or cls._log_listener is None:
+                return
+            cls._log_users -= 1
+            if cls._log_users > 0:
+                return
+            # Flush queued log records and detach the background log writer
+            cls._log_listener.stop()
+            logging.getLogger().removeHandler(cls._log_queue_handler)
+            for handler in cls._log_listener.handlers:
+                handler.close()
+            cls._log_listener = None
+            cls._log_queue_handler = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -628,29 +1153,76 @@ class AISearchAgent:
             self.logger.error(f"{Fore.RED}[FAIL] Failed to load credentials: {e}")
             self.credentials = None
 
-    def login_to_account(self, email, password, driver):
-        """Log in to a Microsoft account."""
+    def _is_logged_in(self, driver) -> bool:
+        """Check whether the browser profile already holds a signed-in session."""
+        try:
+            driver.get(REWARDS_URL)
+            if "login.live.com" in driver.current_url:
+                return False
+            WebDriverWait(driver, 5).until(EC.presence_of_element_located(LOGGED_IN_MARKER))
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _cookie_key(email: str, mode: str) -> str:
+        """Cookie cache key; PC and Mobile sessions of an account are stored separately."""
+        return f"{email}/{mode}"
+
+    def _save_cookies(self, email: str, mode: str, driver) -> None:
+        """Store the browser's cookies for an account and mode in the on-disk cookie cache."""
+        try:
+            cookies = self._cdp(driver, "Network.getAllCookies")["cookies"]
+            with _file_lock(COOKIE_CACHE_LOCK), shelve.open(COOKIE_CACHE_FILE) as cache:
+                cache[self._cookie_key(email, mode)] = [
+                    {k: c[k] for k in COOKIE_PARAM_KEYS if k in c} for c in cookies
+                ]
+        except Exception as e:
+            self.logger.warning(f"{Fore.YELLOW}[WARNING] Could not cache cookies for {email}: {e}")
+
+    def _restore_cookies(self, email: str, mode: str, driver) -> bool:
+        """Load an account's cached cookies for a mode into the browser; True if any were found."""
+        try:
+            with _file_lock(COOKIE_CACHE_LOCK), shelve.open(COOKIE_CACHE_FILE) as cache:
+                cookies = cache.get(self._cookie_key(email, mode))
+            if not cookies:
+                return False
+            self._cdp(driver, "Network.setCookies", {"cookies": cookies})
+            return True
+        except Exception as e:
+            self.logger.debug(f"Cookie cache unavailable for {email}: {e}")
+            return False
+
+    def login_to_account(self, email, password, driver, mode: str = "pc"):
+        """Log in to a Microsoft account: saved profile session, then cached cookies, then password."""
+        if self._is_logged_in(driver):
+            self.logger.info(f"{Fore.GREEN}[OK] Already logged in to {email} (saved profile)")
+            return True
+        
+        if self._restore_cookies(email, mode, driver) and self._is_logged_in(driver):
+            self.logger.info(f"{Fore.GREEN}[OK] Logged in to {email} (cached cookies)")
+            return True
+        
         try:
+            wait = self._wait(driver)
             driver.get("https://login.live.com")
-            WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, "i0116")))
 
             # Enter email
-            email_field = driver.find_element(By.ID, "i0116")
+            email_field = wait.until(EC.presence_of_element_located(LOGIN_EMAIL))
             email_field.clear()
             email_field.send_keys(email)
-            driver.find_element(By.ID, "idSIButton9").click()
+            driver.find_element(*LOGIN_SUBMIT).click()
 
             # Enter password
-            WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, "i0118")))
-            password_field = driver.find_element(By.ID, "i0118")
+            password_field = wait.until(EC.presence_of_element_located(LOGIN_PASSWORD))
             password_field.clear()
             password_field.send_keys(password)
-            driver.find_element(By.ID, "idSIButton9").click()
+            driver.find_element(*LOGIN_SUBMIT).click()
 
             # Handle 'Stay signed in' prompt
-            WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.ID, "idSIButton9")))
-            driver.find_element(By.ID, "idSIButton9").click()
+            wait.until(EC.presence_of_element_located(LOGIN_SUBMIT)).click()
 
+            self._save_cookies(email, mode, driver)
             self.logger.info(f"{Fore.GREEN}[OK] Logged in to {email}")
             return True
         except Exception as e:
@@ -659,66 +1231,163 @@ class AISearchAgent:
 
     def run_with_multiple_accounts(self):
         """Run the search agent for multiple accounts."""
+        asyncio.run(self.run_with_multiple_accounts_async())
+
+    async def run_with_multiple_accounts_async(self) -> None:
+        """Schedule every account concurrently across a bounded pool of worker processes."""
         if not hasattr(self, 'credentials') or not self.credentials:
             self.logger.error(f"{Fore.RED}[FAIL] No credentials loaded")
             return
 
-        for account in self.credentials['accounts']:
+        accounts = self.credentials['accounts']
+        # Each worker holds a PC and a Mobile browser, so the pool is bounded by browsers, not CPUs
+        pool_size = max(1, min(len(accounts), self.config['max_parallel_accounts']))
+        self.logger.info(f"{Fore.MAGENTA}[START] Processing {len(accounts)} accounts with {pool_size} parallel browser slots")
+
+        loop = asyncio.get_running_loop()
+
+        async def run_account(pool: ProcessPoolExecutor, account: Dict[str, str]) -> None:
             email = account['email']
-            password = account['password']
+            try:
+                proxy = self._get_next_proxy()
+            except RuntimeError as e:
+                # Never run an account on the host's own IP when proxies are configured
+                self.logger.error(f"{Fore.RED}[FAIL] Skipping {email}: {e}")
+                return
+            try:
+                await loop.run_in_executor(pool, _run_account, account, proxy, self.config_file)
+                self.logger.info(f"{Fore.GREEN}[OK] Completed processing for {email}")
+            except Exception as e:
+                self.logger.error(f"{Fore.RED}[FAIL] Account {email} failed: {e}")
 
-            # Select a proxy
-            proxy = self._get_next_proxy()
+        # Resolve chromedriver once here so forked workers inherit the path instead of each downloading it
+        self._driver_path
+        
+        # Accounts share no state, so each gets its own process, browsers and proxy
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            await asyncio.gather(*(
+                run_account(pool, account) for account in accounts
+            ))
+
+    def process_account(self, email: str, password: str, proxy=None) -> None:
+        """Log in and run the PC and Mobile search cycles for one account concurrently."""
+        # Open PC and Mobile drivers bound to the account's profiles
+        for mode in MODE_CONFIG:
+            self._initialize_browser(mode, proxy, self._profile_dir(email, mode))
+
+        # Log in on both browsers at once; each login only touches its own driver
+        with ThreadPoolExecutor(max_workers=len(MODE_CONFIG), thread_name_prefix="login") as pool:
+            logins = {mode: pool.submit(self.login_to_account, email, password, self._drivers[mode], mode)
+                      for mode in MODE_CONFIG}
+            logged_in = {mode: future.result() for mode, future in logins.items()}
+
+        # Perform searches for this account; PC and Mobile run side by side in run()
+        if any(logged_in.values()):
+            self.pc_search_history = []
+            self.mobile_search_history = []
+            self.run(
+                pc_cycles=self.config['max_cycles'] if logged_in["pc"] else 0,
+                mobile_cycles=self.config['max_cycles'] if logged_in["mobile"] else 0
+            )
+
+    def _get_next_proxy(self):
+        """Get the next available proxy from the list.
+        
+        Returns None (direct connection) only when no proxies are configured; raises
+        RuntimeError when every configured proxy is quarantined rather than falling back
+        to the host's own IP.
+        """
+        if not self.proxies:
+            self.logger.warning(f"{Fore.YELLOW}[WARNING] No proxies available")
+            return None
+        
+        # Round-robin over the proxies loaded at startup, skipping quarantined ones
+        with self._proxy_lock:
+            if not self._proxies_probed:
+                self._probe_proxies()
+            for _ in range(len(self.proxies)):
+                proxy = next(self._proxy_iter)
+                if self._is_proxy_usable(proxy):
+                    return proxy
+        
+        raise RuntimeError("No reachable proxies available")
 
-            # Initialize PC driver
-            self.pc_driver = None
-            self._initialize_pc_browser(proxy)
 
-            # Log in to the account
-            if self.login_to_account(email, password, self.pc_driver):
-                # Perform searches for this account
-                self.pc_search_history = []
-                self.mobile_search_history = []
-                self.run(pc_cycles=self.config['max_cycles'], mobile_cycles=0)
+def _probe_proxy(proxy, timeout: float) -> bool:
+    """Return True if a TCP connection to the proxy can be opened within the timeout."""
+    try:
+        with socket.create_connection((proxy['host'], int(proxy['port'])), timeout):
+            return True
+    except (OSError, ValueError):
+        return False
 
-            # Clean up PC driver
-            if self.pc_driver:
-                self.pc_driver.quit()
 
-            # Initialize Mobile driver
-            self.mobile_driver = None
-            self._initialize_mobile_browser(proxy)
+def _free_port() -> int:
+    """Ask the OS for an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
 
-            # Log in to the account again for mobile searches
-            if self.login_to_account(email, password, self.mobile_driver):
-                # Perform mobile searches for this account
-                self.run(pc_cycles=0, mobile_cycles=self.config['max_cycles'])
 
-            # Clean up Mobile driver
-            if self.mobile_driver:
-                self.mobile_driver.quit()
+def _try_file_lock(lock_file: IO) -> bool:
+    """Take an exclusive, non-blocking lock on an open file."""
+    try:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
 
-            self.logger.info(f"{Fore.GREEN}[OK] Completed processing for {email}")
 
-    def _get_next_proxy(self):
-        """Get the next available proxy from the list."""
-        if not self.proxies:
-            self.logger.warning(f"{Fore.YELLOW}[WARNING] No proxies available")
-            return None
-        
-        # Simple round-robin approach
-        if not hasattr(self, 'current_proxy_index'):
-            self.current_proxy_index = 0
+def _acquire_file_lock(path: Path, timeout: float) -> IO:
+    """Open a lock file and lock it exclusively, polling until the timeout (TimeoutError)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_file = open(path, 'a+')
+    deadline = time.monotonic() + timeout
+    while not _try_file_lock(lock_file):
+        if time.monotonic() >= deadline:
+            lock_file.close()
+            raise TimeoutError(f"Timed out waiting for lock {path}")
+        time.sleep(0.1)
+    return lock_file
+
+
+def _release_file_lock(lock_file: IO) -> None:
+    """Unlock and close a file locked by _acquire_file_lock."""
+    try:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
         else:
-            self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
-        
-        return self.proxies[self.current_proxy_index]
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        lock_file.close()
+
+
+@contextmanager
+def _file_lock(path: Path, timeout: float = 30):
+    """Hold a cross-process lock file for the duration of the block."""
+    lock_file = _acquire_file_lock(path, timeout)
+    try:
+        yield
+    finally:
+        _release_file_lock(lock_file)
+
+
+def _run_account(account: Dict[str, str], proxy, config_file: str) -> None:
+    """Process one account in a fresh agent (runs inside a worker process)."""
+    with AISearchAgent(config_file, init_browsers=False) as agent:
+        agent.process_account(account['email'], account['password'], proxy)
 
 
 def main():
     """Main entry point."""
     try:
-        with AISearchAgent() as agent:
+        # This agent only dispatches accounts to worker processes; it needs no browsers
+        with AISearchAgent(init_browsers=False) as agent:
             agent.load_credentials()
             agent.run_with_multiple_accounts()
     except KeyboardInterrupt:
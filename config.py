@@ -4,10 +4,26 @@ Configuration and utility functions for the AI Search Agent.
 """
 
 import os
+import importlib.util
 from typing import Dict, Any
 from dataclasses import dataclass
 
 
+# pip distribution names the agent needs (requirements.txt is generated from this)
+REQUIRED_PACKAGES = frozenset([
+    'selenium', 'webdriver-manager', 'google-generativeai', 'colorama',
+    'pandas', 'matplotlib', 'fake-useragent', 'python-dotenv'
+])
+
+# Import names for distributions whose module name differs from the pip name
+PACKAGE_IMPORT_NAMES = {
+    'webdriver-manager': 'webdriver_manager',
+    'google-generativeai': 'google.generativeai',
+    'fake-useragent': 'fake_useragent',
+    'python-dotenv': 'dotenv',
+}
+
+
 @dataclass
 class SearchConfig:
     """Configuration dataclass for search parameters."""
@@ -18,6 +34,8 @@ class SearchConfig:
     max_cycles: int = 54
     min_delay: int = 10
     max_delay: int = 59
+    max_parallel_accounts: int = 4
+    rotate_proxies: bool = False
     
     @classmethod
     def from_env(cls) -> 'SearchConfig':
@@ -29,10 +47,20 @@ class SearchConfig:
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
             max_cycles=int(os.getenv('MAX_SEARCH_CYCLES', '54')),
             min_delay=int(os.getenv('MIN_DELAY', '10')),
-            max_delay=int(os.getenv('MAX_DELAY', '59'))
+            max_delay=int(os.getenv('MAX_DELAY', '59')),
+            max_parallel_accounts=int(os.getenv('MAX_PARALLEL_ACCOUNTS', '4')),
+            rotate_proxies=os.getenv('ROTATE_PROXIES', 'False').lower() == 'true'
         )
 
 
+def _is_installed(module_name: str) -> bool:
+    """Check a module is importable without executing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError:  # Parent package missing
+        return False
+
+
 def validate_environment() -> Dict[str, Any]:
     """Validate environment setup and dependencies."""
     issues = []
@@ -43,17 +71,10 @@ def validate_environment() -> Dict[str, Any]:
         issues.append("GEMINI_API_KEY not properly set in .env file")
     
     # Check required packages
-    required_packages = [
-        'selenium', 'google.generativeai', 'colorama', 
-        'pandas', 'fake_useragent', 'dotenv', 'webdriver_manager'
-    ]
-    
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    missing_packages = sorted(
+        package for package in REQUIRED_PACKAGES
+        if not _is_installed(PACKAGE_IMPORT_NAMES.get(package, package))
+    )
     
     if missing_packages:
         issues.append(f"Missing packages: {', '.join(missing_packages)}")
@@ -8,23 +8,30 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 import queue
-import json
 import os
 import sys
 from pathlib import Path
 import subprocess
+import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+# Only lightweight modules are imported here so the window opens immediately;
+# the agent (selenium, Gemini, ...) is imported when a run or test starts.
 try:
-    from ai_search_agent import AISearchAgent
     from config import validate_environment
 except ImportError:
-    print("Core modules not found. Please ensure ai_search_agent.py is in the same directory.")
-    sys.exit(1)
+    print("Core modules not found. Please ensure config.py is in the same directory.")
+    raise  # An ImportError (not SystemExit) lets run_all fall back to the CLI
 
 
 class SearchAgentGUI:
     """GUI application for the AI Search Agent."""
     
+    # Activity log is capped at this many lines and repainted at most every LOG_FLUSH_MS
+    LOG_MAX_LINES = 2000
+    LOG_FLUSH_MS = 250
+    
     def __init__(self, root):
         """Initialize the GUI."""
         self.root = root
@@ -37,12 +44,22 @@ class SearchAgentGUI:
         self.is_running = False
         self.message_queue = queue.Queue()
         
-        # Setup GUI
+        # Agent calls run one at a time off the Tk thread; delays are Tk timers
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent")
+        self._cycle_plan = []
+        self._delays = []
+        self._after_ids = []
+        self._stop_event = threading.Event()  # Seen by the worker thread mid-cycle
+        self._env_cache = {}
+        self._log_pending = deque(maxlen=self.LOG_MAX_LINES)
+        
+        # Setup GUI; check the environment once the window has been drawn
         self.setup_gui()
-        self.check_environment()
+        self.root.after_idle(self.check_environment)
         
         # Start message processing
         self.process_messages()
+        self._flush_log()
     
     def setup_gui(self):
         """Setup the GUI layout."""
@@ -136,23 +153,31 @@ class SearchAgentGUI:
         self.progress_bar.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
     
     def log_message(self, message: str):
-        """Add message to log display."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        """Queue a message for the log display (painted by _flush_log)."""
+        self._log_pending.append(message)
+    
+    def _flush_log(self):
+        """Append queued log lines in one widget update, dropping the oldest beyond LOG_MAX_LINES."""
+        if self._log_pending:
+            text = "\n".join(self._log_pending) + "\n"
+            self._log_pending.clear()
+            
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, text)
+            line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+            if line_count > self.LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{line_count - self.LOG_MAX_LINES + 1}.0")
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        
+        self.root.after(self.LOG_FLUSH_MS, self._flush_log)
     
     def check_environment(self):
         """Check if environment is properly configured."""
         try:
             # Try to load existing .env file
             if os.path.exists(".env"):
-                with open(".env", "r") as f:
-                    for line in f:
-                        if line.startswith("GEMINI_API_KEY="):
-                            key = line.split("=", 1)[1].strip()
-                            if key and key != "your_gemini_api_key_here":
-                                self.api_key_var.set(key)
+                self.apply_env_settings(self.read_env_file(".env"))
             
             # Validate environment
             result = validate_environment()
@@ -177,17 +202,33 @@ class SearchAgentGUI:
         
         if filename:
             try:
-                with open(filename, "r") as f:
-                    for line in f:
-                        if line.startswith("GEMINI_API_KEY="):
-                            key = line.split("=", 1)[1].strip()
-                            if key:
-                                self.api_key_var.set(key)
-                                self.log_message(f"Loaded API key from {filename}")
-                                break
+                if self.apply_env_settings(self.read_env_file(filename)):
+                    self.log_message(f"Loaded API key from {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to read {filename}: {e}")
     
+    def read_env_file(self, path: str) -> dict:
+        """Parse a .env file, reusing the last result while the file is unchanged."""
+        cache_key = (os.path.abspath(path), os.path.getmtime(path))
+        if cache_key not in self._env_cache:
+            from dotenv import dotenv_values
+            self._env_cache[cache_key] = dotenv_values(path)
+        return self._env_cache[cache_key]
+    
+    def apply_env_settings(self, values: dict) -> bool:
+        """Populate the configuration fields from parsed .env values; True if an API key was set."""
+        for name, var in (("MAX_SEARCH_CYCLES", self.cycles_var),
+                          ("MIN_DELAY", self.min_delay_var),
+                          ("MAX_DELAY", self.max_delay_var)):
+            if values.get(name):
+                var.set(values[name])
+        
+        key = (values.get("GEMINI_API_KEY") or "").strip()
+        if key and key != "your_gemini_api_key_here":
+            self.api_key_var.set(key)
+            return True
+        return False
+    
     def test_setup(self):
         """Test the current setup."""
         def run_test():
@@ -204,12 +245,14 @@ class SearchAgentGUI:
                     self.message_queue.put(("error", "Environment validation failed"))
                     return
                 
-                # Test Gemini connection
+                # Test Gemini connection (a live call; the query cache would hide a bad API key)
                 from ai_search_agent import AISearchAgent
                 agent = AISearchAgent()
-                
-                query, category, query_type = agent.generate_search_query()
-                agent.cleanup()
+                try:
+                    response = agent._call_gemini("Reply with one short, safe web search query and nothing else.")
+                    query = response.text.strip()
+                finally:
+                    agent.cleanup()
                 
                 self.message_queue.put(("success", f"Test successful! Generated query: {query}"))
                 
@@ -239,105 +282,144 @@ MAX_DELAY={self.max_delay_var.get()}
             messagebox.showerror("Error", "Please enter your Gemini API key")
             return
         
-        def run_agent():
-            try:
-                self.message_queue.put(("status", "Initializing agent..."))
-                
-                # Save settings
-                self.save_env_file()
-                
-                # Create and run agent
-                from ai_search_agent import AISearchAgent
-                agent = AISearchAgent()
-                
-                pc_cycles = int(self.cycles_var.get()) // 2
-                mobile_cycles = int(self.cycles_var.get()) - pc_cycles
-                self.message_queue.put(("start", pc_cycles + mobile_cycles))
-                
-                # Run with progress updates
-                for cycle in range(1, pc_cycles + 1):
-                    if not self.is_running:
-                        break
-                    
-                    try:
-                        query, category, query_type = agent.generate_search_query()
-                        self.message_queue.put(("query", f"Cycle {cycle}: {query} (PC)"))
-                        success, url, execution_time = agent.execute_search(query, "pc")
-                        
-                        if success:
-                            self.message_queue.put(("success", f"[SUCCESS] PC Search completed in {execution_time:.2f}s"))
-                        else:
-                            self.message_queue.put(("error", "[FAIL] PC Search failed"))
-                        
-                        progress = (cycle / (pc_cycles + mobile_cycles)) * 100
-                        self.message_queue.put(("progress", progress))
-                        
-                        # Random delay (simplified for GUI)
-                        if cycle < pc_cycles and self.is_running:
-                            import random
-                            delay = random.randint(int(self.min_delay_var.get()), 
-                                                 int(self.max_delay_var.get()))
-                            
-                            for remaining in range(delay, 0, -1):
-                                if not self.is_running:
-                                    break
-                                self.message_queue.put(("delay", f"Next search in: {remaining}s"))
-                                threading.Event().wait(1)
-                    
-                    except Exception as e:
-                        self.message_queue.put(("error", f"PC Cycle {cycle} failed: {e}"))
-                
-                for cycle in range(1, mobile_cycles + 1):
-                    if not self.is_running:
-                        break
-                    
-                    try:
-                        query, category, query_type = agent.generate_search_query()
-                        self.message_queue.put(("query", f"Cycle {cycle + pc_cycles}: {query} (Mobile)"))
-                        success, url, execution_time = agent.execute_search(query, "mobile")
-                        
-                        if success:
-                            self.message_queue.put(("success", f"[SUCCESS] Mobile Search completed in {execution_time:.2f}s"))
-                        else:
-                            self.message_queue.put(("error", "[FAIL] Mobile Search failed"))
-                        
-                        progress = ((cycle + pc_cycles) / (pc_cycles + mobile_cycles)) * 100
-                        self.message_queue.put(("progress", progress))
-                        
-                        # Random delay (simplified for GUI)
-                        if cycle < mobile_cycles and self.is_running:
-                            import random
-                            delay = random.randint(int(self.min_delay_var.get()), 
-                                                 int(self.max_delay_var.get()))
-                            
-                            for remaining in range(delay, 0, -1):
-                                if not self.is_running:
-                                    break
-                                self.message_queue.put(("delay", f"Next search in: {remaining}s"))
-                                threading.Event().wait(1)
-                    
-                    except Exception as e:
-                        self.message_queue.put(("error", f"Mobile Cycle {cycle} failed: {e}"))
-                
-                agent.cleanup()
-                self.message_queue.put(("complete", "Agent finished"))
-                
-            except Exception as e:
-                self.message_queue.put(("error", f"Agent failed: {e}"))
+        try:
+            total_cycles = int(self.cycles_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "Search cycles must be a whole number")
+            return
+        
+        try:
+            min_delay, max_delay = int(self.min_delay_var.get()), int(self.max_delay_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "Delays must be whole numbers of seconds")
+            return
+        if not 0 <= min_delay <= max_delay:
+            messagebox.showerror("Error", "Min delay must be between 0 and max delay")
+            return
+        
+        pc_cycles = total_cycles // 2
+        mobile_cycles = total_cycles - pc_cycles
+        self._cycle_plan = [("pc", cycle) for cycle in range(1, pc_cycles + 1)] + \
+                           [("mobile", cycle) for cycle in range(1, mobile_cycles + 1)]
+        
+        # Delay after each cycle, drawn up front; the PC->Mobile switch and the last cycle have none
+        self._delays = [
+            random.randint(min_delay, max_delay)
+            if index + 1 < len(self._cycle_plan) and self._cycle_plan[index + 1][0] == mode else 0
+            for index, (mode, _) in enumerate(self._cycle_plan)
+        ]
+        self.log_message(f"⏱ Planned wait time between searches: {sum(self._delays) // 60}m {sum(self._delays) % 60}s")
         
         self.is_running = True
+        self._stop_event.clear()
         self.start_button.config(state="disabled")
         self.stop_button.config(state="normal")
         
-        threading.Thread(target=run_agent, daemon=True).start()
+        self._executor.submit(self._init_agent)
+    
+    def _init_agent(self):
+        """Create the agent (worker thread)."""
+        try:
+            self.message_queue.put(("status", "Initializing agent..."))
+            
+            # Save settings
+            self.save_env_file()
+            
+            # Create agent
+            from ai_search_agent import AISearchAgent
+            self.agent = AISearchAgent()
+            
+            self.message_queue.put(("start", len(self._cycle_plan)))
+            self.message_queue.put(("ready", None))
+        except Exception as e:
+            self.message_queue.put(("error", f"Agent failed: {e}"))
+            self.message_queue.put(("finished", None))
+    
+    def _next_cycle(self, index: int):
+        """Dispatch the next search cycle to the worker thread, or finish (Tk main thread)."""
+        self._after_ids.clear()
+        if not self.is_running or index >= len(self._cycle_plan):
+            self._finish_agent()
+            return
+        self._executor.submit(self._run_cycle, index)
+    
+    def _run_cycle(self, index: int):
+        """Generate and execute one search (worker thread)."""
+        mode, cycle = self._cycle_plan[index]
+        label = "PC" if mode == "pc" else "Mobile"
+        try:
+            query, category, query_type = self.agent.generate_search_query()
+            if self._stop_event.is_set():
+                # Stopped while waiting on Gemini: skip the browser work
+                self.message_queue.put(("cycle_done", index))
+                return
+            self.message_queue.put(("query", f"Cycle {index + 1}: {query} ({label})"))
+            success, url, execution_time = self.agent.execute_search(query, mode)
+            
+            if success:
+                self.message_queue.put(("success", f"[SUCCESS] {label} Search completed in {execution_time:.2f}s"))
+            else:
+                self.message_queue.put(("error", f"[FAIL] {label} Search failed"))
+            
+            progress = ((index + 1) / len(self._cycle_plan)) * 100
+            self.message_queue.put(("progress", progress))
+        
+        except Exception as e:
+            self.message_queue.put(("error", f"{label} Cycle {cycle} failed: {e}"))
+        
+        self.message_queue.put(("cycle_done", index))
+    
+    def _schedule_after_cycle(self, index: int):
+        """Wait a random delay on the Tk timer before the next cycle (Tk main thread)."""
+        next_index = index + 1
+        if not self.is_running or next_index >= len(self._cycle_plan):
+            self._finish_agent()
+            return
+        
+        delay = self._delays[index]
+        if not delay:
+            self._next_cycle(next_index)
+            return
+        
+        self._countdown(delay)
+        self._after_ids.append(self.root.after(delay * 1000, lambda: self._next_cycle(next_index)))
+    
+    def _countdown(self, remaining: int):
+        """Show the time left until the next search, once per second."""
+        if not self.is_running:
+            return
+        self.status_var.set(f"Next search in: {remaining}s")
+        if remaining > 1:
+            self._after_ids.append(self.root.after(1000, lambda: self._countdown(remaining - 1)))
+    
+    def _finish_agent(self):
+        """Release the agent on the worker thread and report completion (Tk main thread)."""
+        for after_id in self._after_ids:
+            self.root.after_cancel(after_id)
+        self._after_ids.clear()
+        
+        agent, self.agent = self.agent, None
+        
+        def finish():
+            if agent:
+                agent.cleanup()
+            self.message_queue.put(("complete", "Agent finished"))
+        
+        self._executor.submit(finish)
     
     def stop_agent(self):
         """Stop the search agent."""
+        was_waiting = bool(self._after_ids)
         self.is_running = False
-        self.start_button.config(state="normal")
+        self._stop_event.set()
+        # Start stays disabled until "complete": the worker may still be finishing a cycle
         self.stop_button.config(state="disabled")
         self.status_var.set("Stopping...")
         self.log_message("🛑 Stop requested")
+        
+        # Between cycles nothing is in flight, so wrap up now instead of waiting out the delay
+        if was_waiting:
+            self._finish_agent()
     
     def view_reports(self):
         """Open reports directory."""
@@ -346,45 +428,74 @@ MAX_DELAY={self.max_delay_var.get()}
             if os.name == 'nt':  # Windows
                 os.startfile(reports_dir)
             elif os.name == 'posix':  # macOS/Linux
-                subprocess.run(['open' if sys.platform == 'darwin' else 'xdg-open', reports_dir])
+                # Fire-and-forget so a slow launcher never stalls the Tk main loop
+                subprocess.Popen(['open' if sys.platform == 'darwin' else 'xdg-open', str(reports_dir)],
+                                 start_new_session=True,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         else:
             messagebox.showinfo("Info", "No reports directory found. Run the agent first to generate reports.")
     
     def process_messages(self):
-        """Process messages from background threads."""
+        """Process messages from background threads.
+        
+        The queue is drained first; only the latest status/progress value is applied and
+        log lines are added in one batch, then one-shot state transitions run in order.
+        """
+        latest_status = None
+        latest_progress = None
+        log_lines = []
+        actions = []
+        
         try:
             while True:
                 msg_type, msg_data = self.message_queue.get_nowait()
                 
                 if msg_type == "status":
-                    self.status_var.set(msg_data)
+                    latest_status = msg_data
                 elif msg_type == "error":
-                    self.log_message(f"❌ {msg_data}")
-                    self.status_var.set("Error occurred")
+                    log_lines.append(f"❌ {msg_data}")
+                    latest_status = "Error occurred"
                 elif msg_type == "success":
-                    self.log_message(f"✅ {msg_data}")
+                    log_lines.append(f"✅ {msg_data}")
                 elif msg_type == "query":
-                    self.log_message(f"🤖 {msg_data}")
+                    log_lines.append(f"🤖 {msg_data}")
                 elif msg_type == "start":
-                    self.log_message(f"🚀 Starting {msg_data} search cycles")
-                    self.progress_var.set(0)
+                    log_lines.append(f"🚀 Starting {msg_data} search cycles")
+                    latest_progress = 0
                 elif msg_type == "progress":
-                    self.progress_var.set(msg_data)
-                elif msg_type == "delay":
-                    self.status_var.set(msg_data)
+                    latest_progress = msg_data
+                elif msg_type == "ready":
+                    actions.append(lambda: self._next_cycle(0))
+                elif msg_type == "cycle_done":
+                    actions.append(lambda index=msg_data: self._schedule_after_cycle(index))
+                elif msg_type == "finished":
+                    actions.append(self._finish_agent)
                 elif msg_type == "complete":
-                    self.log_message(f"🎉 {msg_data}")
-                    self.status_var.set("Complete")
-                    self.progress_var.set(100)
-                    self.start_button.config(state="normal")
-                    self.stop_button.config(state="disabled")
-                    self.is_running = False
+                    log_lines.append(f"🎉 {msg_data}")
+                    latest_status = "Complete"
+                    latest_progress = 100
+                    actions.append(self._on_complete)
                 
         except queue.Empty:
             pass
         
+        if latest_status is not None:
+            self.status_var.set(latest_status)
+        if latest_progress is not None:
+            self.progress_var.set(latest_progress)
+        if log_lines:
+            self.log_message("\n".join(log_lines))
+        for action in actions:
+            action()
+        
         # Schedule next check
         self.root.after(100, self.process_messages)
+    
+    def _on_complete(self):
+        """Reset the controls once the agent has finished."""
+        self.start_button.config(state="normal")
+        self.stop_button.config(state="disabled")
+        self.is_running = False
 
 
 def main():
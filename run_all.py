@@ -4,6 +4,7 @@ import sys
 import shutil
 import argparse
 from dotenv import load_dotenv
+from config import REQUIRED_PACKAGES
 load_dotenv()
 
 def install_dependencies(force=False):
@@ -23,16 +24,7 @@ def install_dependencies(force=False):
 
 def create_requirements_file():
     """Create requirements.txt if it doesn't exist."""
-    requirements = [
-        "selenium",
-        "webdriver-manager",
-        "google-generativeai",
-        "colorama",
-        "pandas",
-        "matplotlib",
-        "fake-useragent",
-        "python-dotenv"
-    ]
+    requirements = sorted(REQUIRED_PACKAGES)
     
     if not os.path.exists("requirements.txt"):
         with open("requirements.txt", "w") as f:
@@ -74,13 +66,15 @@ def main():
     # Install dependencies
     install_dependencies(force=args.reinstall)
 
-    # Run the GUI application
+    # Run the GUI application in this interpreter
     try:
-        subprocess.run([sys.executable, "gui.py"], check=True)
-    except subprocess.CalledProcessError:
-        print("Failed to start the GUI application.")
+        from gui import main as gui_main
+        gui_main()
+    except Exception as e:
+        print(f"Failed to start the GUI application: {e}")
         print("Trying to run the command-line version instead...")
-        subprocess.run([sys.executable, "ai_search_agent.py"])
+        from ai_search_agent import main as cli_main
+        cli_main()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file